@@ -16,6 +16,7 @@ Usage:
 
 import argparse
 import json
+import os
 import time
 import subprocess
 import threading
@@ -27,10 +28,27 @@ from pathlib import Path
 import psutil
 import statistics
 
+try:
+    from systemd import journal  # python3-systemd, optional
+except ImportError:
+    journal = None
+
+try:
+    import orjson  # faster report serialization, optional
+except ImportError:
+    orjson = None
+
+SERVER_UNIT = "pqc-chat-server"
+
+# Log and ping output patterns, compiled once rather than per line
+_RE_KYBER = re.compile(r'Kyber key exchange completed for (\w+)')
+_RE_LOGIN = re.compile(r'User (\w+) logged in as (.+)')
+_RE_AUDIO = re.compile(r'Broadcasting audio to room (\w+)')
+_RE_PING = re.compile(r'time=(\d+\.?\d*)')
+
 class KyberPerformanceLogger:
     def __init__(self, output_file="kyber_performance_report.json", server_ip="127.0.0.1"):
         # Ensure results directory exists
-        import os
         results_dir = "./results"
         os.makedirs(results_dir, exist_ok=True)
         
@@ -53,8 +71,19 @@ class KyberPerformanceLogger:
             "network_metrics": [],
             "summary": {}
         }
+        # Direct references to the event lists appended to on hot paths
+        self._kyber_list = self.metrics["kyber_exchanges"]
+        self._conn_list = self.metrics["connection_metrics"]
+        self._audio_list = self.metrics["audio_metrics"]
+        self._sys_list = self.metrics["system_metrics"]
+        self._net_list = self.metrics["network_metrics"]
+        # Summary counts kept up to date as events arrive
+        self._kyber_success = 0
+        self._unique_users = set()
+        self._active_rooms = set()
         self.log_queue = queue.Queue()
         self.running = False
+        self._processes = {}
         
     def start_logging(self, duration_seconds=60):
         """Start performance logging for specified duration"""
@@ -65,6 +94,10 @@ class KyberPerformanceLogger:
         self.metrics["test_session"]["start_time"] = datetime.now().isoformat()
         self.running = True
         
+        # Prime psutil's CPU counters so the first non-blocking sample is a
+        # real measurement
+        psutil.cpu_percent(interval=None)
+        
         # Start monitoring threads
         threads = [
             threading.Thread(target=self._monitor_server_logs),
@@ -95,9 +128,13 @@ class KyberPerformanceLogger:
     def _monitor_server_logs(self):
         """Monitor server logs for Kyber key exchange events"""
         try:
-            # Monitor systemd journal for server logs
+            if journal is not None:
+                self._follow_journal()
+                return
+            
+            # No journal bindings, fall back to following journalctl output
             proc = subprocess.Popen(
-                ["journalctl", "-u", "pqc-chat-server", "-f", "--since", "now"],
+                ["journalctl", "-u", SERVER_UNIT, "-f", "--since", "now"],
                 stdout=subprocess.PIPE,
                 stderr=subprocess.PIPE,
                 text=True,
@@ -112,6 +149,23 @@ class KyberPerformanceLogger:
         except Exception as e:
             print(f"⚠️ Server log monitoring error: {e}")
     
+    def _follow_journal(self):
+        """Read server log entries straight from the systemd journal"""
+        reader = journal.Reader()
+        reader.add_match(_SYSTEMD_UNIT=f"{SERVER_UNIT}.service")
+        # Start at the end, like journalctl --since now
+        reader.seek_tail()
+        reader.get_previous()
+        
+        while self.running:
+            # Time out periodically so a stop request is noticed
+            if reader.wait(1.0) != journal.APPEND:
+                continue
+            # Drain everything that arrived with one shared timestamp
+            batch_ts = time.time()
+            for entry in reader:
+                self._parse_server_log_line(entry.get("MESSAGE", ""), batch_ts)
+    
     def _monitor_client_logs(self):
         """Monitor client application logs"""
         # This would monitor RUST_LOG output from GUI applications
@@ -122,11 +176,18 @@ class KyberPerformanceLogger:
         """Monitor CPU, memory, and system resource usage"""
         while self.running:
             try:
-                cpu_percent = psutil.cpu_percent(interval=1)
+                # Sample at the end of each interval, so every non-blocking
+                # reading covers a full 5 seconds since the previous call
+                time.sleep(5)
+                if not self.running:
+                    break
+                
+                # Usage since the previous sample; returns immediately
+                cpu_percent = psutil.cpu_percent(interval=None)
                 memory = psutil.virtual_memory()
                 
                 metric = {
-                    "timestamp": datetime.now().isoformat(),
+                    "timestamp": time.time(),
                     "cpu_percent": cpu_percent,
                     "memory_percent": memory.percent,
                     "memory_used_mb": memory.used // (1024 * 1024),
@@ -134,127 +195,178 @@ class KyberPerformanceLogger:
                 }
                 
                 # Check for PQC processes
-                pqc_processes = []
-                for proc in psutil.process_iter(['pid', 'name', 'cpu_percent', 'memory_percent']):
-                    try:
-                        if 'pqc' in proc.info['name'].lower():
-                            pqc_processes.append({
-                                "pid": proc.info['pid'],
-                                "name": proc.info['name'],
-                                "cpu_percent": proc.info['cpu_percent'],
-                                "memory_percent": proc.info['memory_percent']
-                            })
-                    except (psutil.NoSuchProcess, psutil.AccessDenied):
-                        pass
-                
-                metric["pqc_processes"] = pqc_processes
-                self.metrics["system_metrics"].append(metric)
-                
-                time.sleep(5)  # Sample every 5 seconds
+                metric["pqc_processes"] = self._sample_pqc_processes()
+                self._sys_list.append(metric)
                 
             except Exception as e:
                 print(f"⚠️ System metrics error: {e}")
                 break
     
+    def _sample_pqc_processes(self):
+        """Collect CPU and memory usage of running PQC processes"""
+        pqc_processes = []
+        pids = psutil.pids()
+        for pid in pids:
+            try:
+                # Process objects are kept between samples because
+                # cpu_percent() measures from the previous call on the same one
+                proc = self._processes.get(pid)
+                if proc is None:
+                    proc = self._processes[pid] = psutil.Process(pid)
+                # oneshot() reads each /proc file once for all of the calls below
+                with proc.oneshot():
+                    name = proc.name()
+                    if 'pqc' in name.lower():
+                        pqc_processes.append({
+                            "pid": pid,
+                            "name": name,
+                            "cpu_percent": proc.cpu_percent(),
+                            "memory_percent": proc.memory_percent()
+                        })
+            except (psutil.NoSuchProcess, psutil.AccessDenied):
+                self._processes.pop(pid, None)
+        
+        # Forget processes that have exited
+        for pid in self._processes.keys() - set(pids):
+            del self._processes[pid]
+        
+        return pqc_processes
+    
     def _monitor_network_metrics(self):
         """Monitor network latency to server"""
         while self.running:
+            proc = None
             try:
-                # Ping server to measure latency
-                result = subprocess.run(
-                    ["ping", "-c", "1", "-W", "1", self.server_ip],
-                    capture_output=True,
-                    text=True
+                # One long-running ping every 2 seconds instead of a new
+                # process per sample. -O reports unanswered requests so
+                # timeouts show up as a line too, like ICMP errors do.
+                proc = subprocess.Popen(
+                    ["ping", "-O", "-i", "2", "-W", "1", self.server_ip],
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.DEVNULL,
+                    text=True,
+                    bufsize=1
                 )
                 
-                if result.returncode == 0:
+                for line in proc.stdout:
+                    if not self.running:
+                        break
+                    
                     # Parse ping output for latency
-                    ping_match = re.search(r'time=(\d+\.?\d*)', result.stdout)
+                    ping_match = _RE_PING.search(line)
                     if ping_match:
-                        latency_ms = float(ping_match.group(1))
-                        
                         metric = {
-                            "timestamp": datetime.now().isoformat(),
-                            "latency_ms": latency_ms,
+                            "timestamp": time.time(),
+                            "latency_ms": float(ping_match.group(1)),
                             "packet_loss": 0
                         }
-                        self.metrics["network_metrics"].append(metric)
-                else:
-                    # Packet loss
+                        self._net_list.append(metric)
+                    elif 'icmp_seq=' in line:
+                        # A request without a reply time: "no answer yet"
+                        # or an ICMP error such as Destination Host Unreachable
+                        metric = {
+                            "timestamp": time.time(),
+                            "latency_ms": None,
+                            "packet_loss": 1
+                        }
+                        self._net_list.append(metric)
+                
+            except Exception as e:
+                print(f"⚠️ Network metrics error: {e}")
+            finally:
+                if proc is not None and proc.poll() is None:
+                    proc.terminate()
+                    proc.wait()
+            
+            # ping exited on its own (e.g. network unreachable); count that
+            # attempt as lost and retry shortly
+            if self.running:
+                if proc is not None:
                     metric = {
-                        "timestamp": datetime.now().isoformat(),
+                        "timestamp": time.time(),
                         "latency_ms": None,
                         "packet_loss": 1
                     }
-                    self.metrics["network_metrics"].append(metric)
-                
-                time.sleep(2)  # Ping every 2 seconds
-                
-            except Exception as e:
-                print(f"⚠️ Network metrics error: {e}")
+                    self._net_list.append(metric)
                 time.sleep(2)
     
-    def _parse_server_log_line(self, line):
+    def _parse_server_log_line(self, line, timestamp=None):
         """Parse server log lines for Kyber-related events"""
-        timestamp_str = datetime.now().isoformat()
+        if timestamp is None:
+            timestamp = time.time()
         
-        # Detect Kyber key exchange completion
-        kyber_match = re.search(r'Kyber key exchange completed for (\w+)', line)
-        if kyber_match:
-            participant_id = kyber_match.group(1)
-            
-            exchange = {
-                "timestamp": timestamp_str,
-                "participant_id": participant_id,
-                "status": "completed",
-                "operation": "server_side_complete"
-            }
-            self.metrics["kyber_exchanges"].append(exchange)
-            print(f"🔐 Kyber exchange completed for {participant_id}")
+        # Most lines match nothing, so a cheap substring check gates each
+        # regex and the common case never enters the regex engine. A line
+        # carries at most one event, so checks stop at the first hit and run
+        # in the order the server actually emits them: a login and a Kyber
+        # exchange per connection.
         
         # Detect connection events
-        login_match = re.search(r'User (\w+) logged in as (.+)', line)
-        if login_match:
-            participant_id = login_match.group(1)
-            username = login_match.group(2)
-            
-            connection = {
-                "timestamp": timestamp_str,
-                "participant_id": participant_id,
-                "username": username,
-                "event": "login_success"
-            }
-            self.metrics["connection_metrics"].append(connection)
-            print(f"👤 User login: {username}")
+        if 'logged in as' in line:
+            login_match = _RE_LOGIN.search(line)
+            if login_match:
+                participant_id = login_match.group(1)
+                username = login_match.group(2)
+                
+                connection = {
+                    "timestamp": timestamp,
+                    "participant_id": participant_id,
+                    "username": username,
+                    "event": "login_success"
+                }
+                self._conn_list.append(connection)
+                self._unique_users.add(username)
+                print(f"👤 User login: {username}")
+                return
         
-        # Detect audio transmission events
-        audio_match = re.search(r'Broadcasting audio to room (\w+)', line)
-        if audio_match:
-            room_id = audio_match.group(1)
-            
-            audio = {
-                "timestamp": timestamp_str,
-                "room_id": room_id,
-                "event": "audio_broadcast"
-            }
-            self.metrics["audio_metrics"].append(audio)
+        # Detect Kyber key exchange completion
+        if 'Kyber key exchange' in line:
+            kyber_match = _RE_KYBER.search(line)
+            if kyber_match:
+                participant_id = kyber_match.group(1)
+                
+                exchange = {
+                    "timestamp": timestamp,
+                    "participant_id": participant_id,
+                    "status": "completed",
+                    "operation": "server_side_complete"
+                }
+                self._kyber_list.append(exchange)
+                self._kyber_success += 1
+                print(f"🔐 Kyber exchange completed for {participant_id}")
+                return
+        
+        # Detect audio transmission events. pqc-server does not currently log
+        # per-room audio broadcasts, so this stays last until it does
+        if 'Broadcasting audio' in line:
+            audio_match = _RE_AUDIO.search(line)
+            if audio_match:
+                room_id = audio_match.group(1)
+                
+                audio = {
+                    "timestamp": timestamp,
+                    "room_id": room_id,
+                    "event": "audio_broadcast"
+                }
+                self._audio_list.append(audio)
+                self._active_rooms.add(room_id)
     
     def _generate_summary(self):
         """Generate performance summary statistics"""
         summary = {
             "kyber_performance": {
                 "total_exchanges": len(self.metrics["kyber_exchanges"]),
-                "successful_exchanges": len([e for e in self.metrics["kyber_exchanges"] if e["status"] == "completed"]),
+                "successful_exchanges": self._kyber_success,
                 "success_rate": 0,
                 "average_time_between_exchanges": None
             },
             "connection_performance": {
                 "total_connections": len(self.metrics["connection_metrics"]),
-                "unique_users": len(set(c["username"] for c in self.metrics["connection_metrics"]))
+                "unique_users": len(self._unique_users)
             },
             "audio_performance": {
                 "total_audio_events": len(self.metrics["audio_metrics"]),
-                "active_rooms": len(set(a["room_id"] for a in self.metrics["audio_metrics"]))
+                "active_rooms": len(self._active_rooms)
             },
             "system_performance": {},
             "network_performance": {}
@@ -273,9 +385,9 @@ class KyberPerformanceLogger:
             memory_values = [m["memory_percent"] for m in self.metrics["system_metrics"]]
             
             summary["system_performance"] = {
-                "avg_cpu_percent": statistics.mean(cpu_values),
+                "avg_cpu_percent": statistics.fmean(cpu_values),
                 "max_cpu_percent": max(cpu_values),
-                "avg_memory_percent": statistics.mean(memory_values),
+                "avg_memory_percent": statistics.fmean(memory_values),
                 "max_memory_percent": max(memory_values),
                 "total_samples": len(cpu_values)
             }
@@ -287,7 +399,7 @@ class KyberPerformanceLogger:
             
             if latencies:
                 summary["network_performance"] = {
-                    "avg_latency_ms": statistics.mean(latencies),
+                    "avg_latency_ms": statistics.fmean(latencies),
                     "min_latency_ms": min(latencies),
                     "max_latency_ms": max(latencies),
                     "packet_loss_rate": sum(packet_losses) / len(packet_losses) * 100,
@@ -298,8 +410,21 @@ class KyberPerformanceLogger:
     
     def _save_report(self):
         """Save performance report to JSON file"""
-        with open(self.output_file, 'w') as f:
-            json.dump(self.metrics, f, indent=2)
+        # Events are stamped with epoch seconds while collecting; format them
+        # for the report only once, here
+        for events in (self._kyber_list, self._conn_list, self._audio_list,
+                       self._sys_list, self._net_list):
+            for event in events:
+                ts = event["timestamp"]
+                if isinstance(ts, float):
+                    event["timestamp"] = datetime.fromtimestamp(ts).isoformat()
+        
+        if orjson is not None:
+            with open(self.output_file, 'wb') as f:
+                f.write(orjson.dumps(self.metrics, option=orjson.OPT_INDENT_2))
+        else:
+            with open(self.output_file, 'w') as f:
+                json.dump(self.metrics, f, indent=2)
     
     def generate_human_readable_report(self):
         """Generate a human-readable report for presentations"""
@@ -6,7 +6,9 @@
 use cpal::traits::{DeviceTrait, HostTrait, StreamTrait};
 use cpal::{Device, Host, Stream, StreamConfig};
 use ringbuf::{HeapRb, HeapProducer, HeapConsumer};
+use std::sync::atomic::{AtomicBool, Ordering};
 use std::sync::{Arc, Mutex};
+use std::thread::JoinHandle;
 use thiserror::Error;
 
 /// Audio-related errors
@@ -30,6 +32,25 @@ const BUFFER_SIZE: usize = 960;  // 20ms at 48kHz - good balance
 // Playback buffer in milliseconds. Lower values reduce latency but increase
 // risk of underruns. Default to 80ms as a reasonable balance for Raspberry Pi 5.
 const PLAYBACK_BUFFER_MS: usize = 80;  // 80ms buffer - lower latency
+const PLAYBACK_BUFFER_SAMPLES: usize = (SAMPLE_RATE as usize * PLAYBACK_BUFFER_MS) / 1000;
+// Capture ring between the input callback and the capture worker, in frames.
+// Small and bounded so a stalled consumer drops audio instead of adding delay.
+const CAPTURE_RING_FRAMES: usize = 4;  // 80ms
+
+/// Worker thread that drains captured frames out of the realtime input callback
+struct CaptureWorker {
+    running: Arc<AtomicBool>,
+    handle: JoinHandle<()>,
+}
+
+impl CaptureWorker {
+    /// Signal the worker to exit and wait for it
+    fn stop(self) {
+        self.running.store(false, Ordering::Release);
+        self.handle.thread().unpark();
+        let _ = self.handle.join();
+    }
+}
 
 /// Audio Manager - handles both capture and playback
 pub struct AudioManager {
@@ -38,6 +59,10 @@ pub struct AudioManager {
     output_device: Option<Device>,
     input_stream: Option<Stream>,
     output_stream: Option<Stream>,
+    capture_worker: Option<CaptureWorker>,
+    // Device enumeration is slow (ALSA probes every card), so cache it
+    input_device_names: Mutex<Option<Vec<String>>>,
+    output_device_names: Mutex<Option<Vec<String>>>,
     audio_tx: Arc<Mutex<Option<HeapProducer<f32>>>>,
     audio_rx: Arc<Mutex<Option<HeapConsumer<f32>>>>,
 }
@@ -53,44 +78,59 @@ impl AudioManager {
             output_device: None,
             input_stream: None,
             output_stream: None,
+            capture_worker: None,
+            input_device_names: Mutex::new(None),
+            output_device_names: Mutex::new(None),
             audio_tx: Arc::new(Mutex::new(None)),
             audio_rx: Arc::new(Mutex::new(None)),
         })
     }
 
     /// List available input devices
+    ///
+    /// The result is cached; call `refresh_devices` after a hotplug event.
     pub fn list_input_devices(&self) -> Result<Vec<String>, AudioError> {
-        let devices = self.host.input_devices()?;
-        let mut device_names = Vec::new();
-        
-        for device in devices {
-            if let Ok(name) = device.name() {
-                device_names.push(name);
-            }
+        let mut cached = self.input_device_names.lock().unwrap();
+        if let Some(names) = cached.as_ref() {
+            return Ok(names.clone());
         }
         
-        Ok(device_names)
+        let devices = self.host.input_devices()?;
+        let names = device_names(devices);
+        *cached = Some(names.clone());
+        Ok(names)
     }
 
     /// List available output devices
+    ///
+    /// The result is cached; call `refresh_devices` after a hotplug event.
     pub fn list_output_devices(&self) -> Result<Vec<String>, AudioError> {
-        let devices = self.host.output_devices()?;
-        let mut device_names = Vec::new();
-        
-        for device in devices {
-            if let Ok(name) = device.name() {
-                device_names.push(name);
-            }
+        let mut cached = self.output_device_names.lock().unwrap();
+        if let Some(names) = cached.as_ref() {
+            return Ok(names.clone());
         }
         
-        Ok(device_names)
+        let devices = self.host.output_devices()?;
+        let names = device_names(devices);
+        *cached = Some(names.clone());
+        Ok(names)
+    }
+
+    /// Drop cached device lists so the next listing re-enumerates devices
+    pub fn refresh_devices(&self) {
+        *self.input_device_names.lock().unwrap() = None;
+        *self.output_device_names.lock().unwrap() = None;
     }
 
     /// Initialize audio capture from microphone
     pub fn start_capture<F>(&mut self, mut callback: F) -> Result<(), AudioError>
     where
-        F: FnMut(Vec<f32>) + Send + 'static,
+        F: FnMut(&[f32]) + Send + 'static,
     {
+        // Stop any previous capture first; a replaced worker would otherwise
+        // stay parked forever, holding on to its callback
+        self.stop_capture();
+
         // Get default input device
         let device = self.host
             .default_input_device()
@@ -99,40 +139,70 @@ impl AudioManager {
         log::info!("Using input device: {}", device.name().unwrap_or_else(|_| "Unknown".to_string()));
         
         // Try to use our desired config
-        let config = StreamConfig {
-            channels: CHANNELS,
-            sample_rate: cpal::SampleRate(SAMPLE_RATE),
-            buffer_size: cpal::BufferSize::Fixed(BUFFER_SIZE as u32),
-        };
+        let config = stream_config();
         
-        // Build input stream - send immediately for lowest latency
-        let mut audio_buffer = Vec::with_capacity(BUFFER_SIZE);
+        // Samples go from the realtime input callback to a dedicated worker
+        // through a lock-free SPSC ring buffer. The worker runs the (possibly
+        // slow) encode/send callback, so it can never stall capture.
+        let ring_buffer = HeapRb::<f32>::new(BUFFER_SIZE * CAPTURE_RING_FRAMES);
+        let (mut producer, mut consumer) = ring_buffer.split();
+        
+        let running = Arc::new(AtomicBool::new(true));
+        let worker_running = running.clone();
+        let handle = std::thread::Builder::new()
+            .name("audio-capture".to_string())
+            .spawn(move || {
+                // The frame buffer is allocated once and reused for every frame
+                let mut frame = vec![0.0f32; BUFFER_SIZE];
+                while worker_running.load(Ordering::Acquire) {
+                    if consumer.len() >= BUFFER_SIZE {
+                        consumer.pop_slice(&mut frame);
+                        callback(&frame);
+                    } else {
+                        std::thread::park();
+                    }
+                }
+            })
+            .map_err(|e| AudioError::Other(e.to_string()))?;
+        let worker = CaptureWorker { running, handle };
+        let worker_thread = worker.handle.thread().clone();
         
+        // Build input stream - send immediately for lowest latency
         let stream = device.build_input_stream(
             &config,
             move |data: &[f32], _: &cpal::InputCallbackInfo| {
-                // For ultra-low latency: send data as soon as we get any
-                // Don't wait to accumulate a full buffer
-                for sample in data {
-                    audio_buffer.push(*sample);
-                    
-                    // Send when we have minimum viable packet size
-                    if audio_buffer.len() >= BUFFER_SIZE {
-                        let chunk: Vec<f32> = audio_buffer.drain(..BUFFER_SIZE).collect();
-                        callback(chunk);
-                    }
+                // If the worker has fallen behind the ring is full and the
+                // newest samples are dropped rather than queued up as latency
+                producer.push_slice(data);
+                
+                // Wake the worker once a full frame is available
+                if producer.len() >= BUFFER_SIZE {
+                    worker_thread.unpark();
                 }
             },
             |err| {
                 log::error!("Audio input error: {}", err);
             },
             None,
-        ).map_err(|e| AudioError::StreamError(e.to_string()))?;
+        );
         
-        stream.play().map_err(|e| AudioError::StreamError(e.to_string()))?;
+        let stream = match stream {
+            Ok(stream) => stream,
+            Err(e) => {
+                worker.stop();
+                return Err(AudioError::StreamError(e.to_string()));
+            }
+        };
+        
+        if let Err(e) = stream.play() {
+            drop(stream);
+            worker.stop();
+            return Err(AudioError::StreamError(e.to_string()));
+        }
         
         self.input_device = Some(device);
         self.input_stream = Some(stream);
+        self.capture_worker = Some(worker);
         
         log::info!("Audio capture started: {}Hz, {} channels", SAMPLE_RATE, CHANNELS);
         Ok(())
@@ -148,16 +218,10 @@ impl AudioManager {
         log::info!("Using output device: {}", device.name().unwrap_or_else(|_| "Unknown".to_string()));
         
         // Try to use our desired config
-        let config = StreamConfig {
-            channels: CHANNELS,
-            sample_rate: cpal::SampleRate(SAMPLE_RATE),
-            buffer_size: cpal::BufferSize::Fixed(BUFFER_SIZE as u32),
-        };
+        let config = stream_config();
         
         // Create ring buffer for audio data - smaller buffer for lower latency
-        // 60ms buffer - very tight for lowest latency
-        let buffer_samples = (SAMPLE_RATE as usize * PLAYBACK_BUFFER_MS) / 1000;
-        let ring_buffer = HeapRb::<f32>::new(buffer_samples); 
+        let ring_buffer = HeapRb::<f32>::new(PLAYBACK_BUFFER_SAMPLES);
         let (mut producer, mut consumer) = ring_buffer.split();
         
         // NO prefill - start immediately to minimize latency
@@ -193,6 +257,9 @@ impl AudioManager {
             drop(stream);
             log::info!("Audio capture stopped");
         }
+        if let Some(worker) = self.capture_worker.take() {
+            worker.stop();
+        }
         self.input_device = None;
     }
 
@@ -228,24 +295,37 @@ impl Drop for AudioManager {
     }
 }
 
+/// Collect the names of enumerated devices, skipping unnamed ones
+fn device_names(devices: impl Iterator<Item = Device>) -> Vec<String> {
+    devices.filter_map(|device| device.name().ok()).collect()
+}
+
+/// Stream configuration shared by capture and playback
+fn stream_config() -> StreamConfig {
+    StreamConfig {
+        channels: CHANNELS,
+        sample_rate: cpal::SampleRate(SAMPLE_RATE),
+        buffer_size: cpal::BufferSize::Fixed(BUFFER_SIZE as u32),
+    }
+}
+
 /// Helper function to convert f32 samples to bytes for transmission
 pub fn samples_to_bytes(samples: &[f32]) -> Vec<u8> {
-    let mut bytes = Vec::with_capacity(samples.len() * 4);
-    for sample in samples {
-        bytes.extend_from_slice(&sample.to_le_bytes());
+    // Fixed-size chunk writes with no per-sample length checks, so the
+    // compiler can vectorize the loop
+    let mut bytes = vec![0u8; samples.len() * 4];
+    for (chunk, sample) in bytes.chunks_exact_mut(4).zip(samples) {
+        chunk.copy_from_slice(&sample.to_le_bytes());
     }
     bytes
 }
 
 /// Helper function to convert bytes to f32 samples for playback
 pub fn bytes_to_samples(bytes: &[u8]) -> Vec<f32> {
-    let mut samples = Vec::with_capacity(bytes.len() / 4);
-    for chunk in bytes.chunks_exact(4) {
-        if let Ok(array) = chunk.try_into() {
-            samples.push(f32::from_le_bytes(array));
-        }
-    }
-    samples
+    bytes
+        .chunks_exact(4)
+        .map(|c| f32::from_le_bytes([c[0], c[1], c[2], c[3]]))
+        .collect()
 }
 
 #[cfg(test)]
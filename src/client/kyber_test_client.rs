@@ -129,13 +129,17 @@ async fn main() -> Result<()> {
         },
     };
 
+    // One connector for every attempt, so building the TLS config is not
+    // counted as handshake time
+    let connector = tls_connector();
+
     // Run connection attempts
     for attempt in 1..=args.attempts {
         if !args.json && args.attempts > 1 {
             println!("🔄 Attempt {}/{}", attempt, args.attempts);
         }
 
-        let metrics = perform_connection_test(&args.server, args.port, &args.username, attempt).await;
+        let metrics = perform_connection_test(&connector, &args.server, args.port, &args.username, attempt).await;
         
         if metrics.success {
             test_results.successful_attempts += 1;
@@ -166,7 +170,26 @@ async fn main() -> Result<()> {
     Ok(())
 }
 
-async fn perform_connection_test(host: &str, port: u16, username: &str, attempt: u32) -> ConnectionMetrics {
+/// Build the TLS connector shared by all attempts
+///
+/// Session resumption is disabled so every attempt measures a full handshake.
+fn tls_connector() -> TlsConnector {
+    let mut tls_config = rustls::ClientConfig::builder()
+        .dangerous()
+        .with_custom_certificate_verifier(Arc::new(NoVerifier))
+        .with_no_client_auth();
+    tls_config.resumption = rustls::client::Resumption::disabled();
+
+    TlsConnector::from(Arc::new(tls_config))
+}
+
+async fn perform_connection_test(
+    connector: &TlsConnector,
+    host: &str,
+    port: u16,
+    username: &str,
+    attempt: u32,
+) -> ConnectionMetrics {
     let mut metrics = ConnectionMetrics {
         attempt_number: attempt,
         timestamp: chrono::Utc::now().to_rfc3339(),
@@ -202,15 +225,13 @@ async fn perform_connection_test(host: &str, port: u16, username: &str, attempt:
             return metrics;
         }
     };
+    // Same socket options as the real clients, so the timings match them
+    if let Err(e) = stream.set_nodelay(true) {
+        warn!("Failed to set TCP_NODELAY: {}", e);
+    }
 
     // TLS Handshake
     let tls_start = Instant::now();
-    let tls_config = rustls::ClientConfig::builder()
-        .dangerous()
-        .with_custom_certificate_verifier(Arc::new(NoVerifier))
-        .with_no_client_auth();
-
-    let connector = TlsConnector::from(Arc::new(tls_config));
     let server_name = match ServerName::try_from(host.to_string()) {
         Ok(name) => name,
         Err(e) => {
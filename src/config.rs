@@ -3,7 +3,7 @@
 //! Configuration structures for server and client.
 
 use serde::{Deserialize, Serialize};
-use std::path::PathBuf;
+use std::path::{Path, PathBuf};
 
 /// Server configuration
 #[derive(Debug, Clone, Serialize, Deserialize)]
@@ -50,7 +50,7 @@ impl Default for ServerConfig {
 
 impl ServerConfig {
     /// Load configuration from a TOML file
-    pub fn from_file(path: &str) -> Result<Self, ConfigError> {
+    pub fn from_file<P: AsRef<Path>>(path: P) -> Result<Self, ConfigError> {
         let content = std::fs::read_to_string(path)
             .map_err(|e| ConfigError::IoError(e.to_string()))?;
         toml::from_str(&content)
@@ -168,7 +168,7 @@ impl Default for ClientConfig {
 
 impl ClientConfig {
     /// Load configuration from a TOML file
-    pub fn from_file(path: &str) -> Result<Self, ConfigError> {
+    pub fn from_file<P: AsRef<Path>>(path: P) -> Result<Self, ConfigError> {
         let content = std::fs::read_to_string(path)
             .map_err(|e| ConfigError::IoError(e.to_string()))?;
         toml::from_str(&content)
@@ -20,6 +20,17 @@ use pqc_chat::crypto::kyber::KyberKeyExchange;
 #[cfg(feature = "gui")]
 use pqc_chat::protocol::{ParticipantInfo, RoomInfo, SignalingMessage};
 
+// Room list requests closer together than this reuse the list already shown
+#[cfg(feature = "gui")]
+const ROOM_LIST_REFRESH_INTERVAL: std::time::Duration = std::time::Duration::from_millis(500);
+
+// How often the GUI wakes up to drain backend updates when no input arrives.
+// During a call that is one Opus frame, so received audio is not held back.
+#[cfg(feature = "gui")]
+const UPDATE_POLL_INTERVAL: std::time::Duration = std::time::Duration::from_millis(100);
+#[cfg(feature = "gui")]
+const CALL_UPDATE_POLL_INTERVAL: std::time::Duration = std::time::Duration::from_millis(20);
+
 // Helper function for formatting timestamps
 fn format_time(time: std::time::SystemTime) -> String {
     if let Ok(duration) = time.duration_since(std::time::UNIX_EPOCH) {
@@ -110,10 +121,12 @@ struct EnhancedPqcChatApp {
 
     // Room state
     rooms: Vec<RoomData>,
+    room_labels: Vec<String>,  // display text for each entry in `rooms`
     current_room: Option<RoomData>,
     selected_room_idx: Option<usize>,
     new_room_name: String,
     room_participants: Vec<ParticipantInfo>,
+    last_room_list_request: Option<std::time::Instant>,
 
     // User management
     connected_users: HashMap<String, ConnectedUser>,
@@ -218,10 +231,12 @@ impl EnhancedPqcChatApp {
             is_connected: false,
             connection_status: "Disconnected".to_string(),
             rooms: Vec::new(),
+            room_labels: Vec::new(),
             current_room: None,
             selected_room_idx: None,
             new_room_name: String::new(),
             room_participants: Vec::new(),
+            last_room_list_request: None,
             connected_users: HashMap::new(),
             user_list_scroll: 0.0,
             room_chat_history: HashMap::new(),
@@ -275,6 +290,8 @@ impl EnhancedPqcChatApp {
                     self.is_connected = false;
                     self.connection_status = "Disconnected".to_string();
                     self.rooms.clear();
+                    self.room_labels.clear();
+                    self.last_room_list_request = None;
                     self.current_room = None;
                     self.connected_users.clear();
                     self.room_participants.clear();
@@ -292,11 +309,20 @@ impl EnhancedPqcChatApp {
                         max_participants: r.max_participants,
                         is_locked: r.is_locked,
                     }).collect();
+                    // Labels only change when a new list arrives, so build them
+                    // here rather than formatting every room on every frame
+                    self.room_labels = self.rooms.iter().map(|room| format!(
+                        "🏠 {} ({}/{}{})",
+                        room.name,
+                        room.participants,
+                        room.max_participants,
+                        if room.is_locked { " 🔒" } else { "" }
+                    )).collect();
                 },
                 GuiUpdate::RoomJoined { room, participants } => {
-                    eprintln!("DEBUG: RoomJoined - received {} participants", participants.len());
+                    log::debug!("RoomJoined - received {} participants", participants.len());
                     for (i, p) in participants.iter().enumerate() {
-                        eprintln!("DEBUG: Participant {}: {} ({})", i, p.username, p.id);
+                        log::debug!("Participant {}: {} ({})", i, p.username, p.id);
                     }
                     
                     self.current_room = Some(RoomData {
@@ -307,6 +333,7 @@ impl EnhancedPqcChatApp {
                         is_locked: room.is_locked,
                     });
                     self.room_participants = participants;
+                    self.last_room_list_request = None;
                     self.add_status_message(format!("🎉 Joined room: {} with {} participants", room.name, self.room_participants.len()));
                 },
                 GuiUpdate::RoomLeft => {
@@ -315,9 +342,10 @@ impl EnhancedPqcChatApp {
                     }
                     self.current_room = None;
                     self.room_participants.clear();
+                    self.last_room_list_request = None;
                 },
                 GuiUpdate::ParticipantJoined { participant } => {
-                    eprintln!("DEBUG: ParticipantJoined - {} ({})", participant.username, participant.id);
+                    log::debug!("ParticipantJoined - {} ({})", participant.username, participant.id);
                     self.room_participants.push(participant.clone());
                     
                     // Update current room participant count
@@ -375,7 +403,7 @@ impl EnhancedPqcChatApp {
                     }
                 },
                 GuiUpdate::ChatMessageReceived { message } => {
-                    eprintln!("DEBUG: GuiUpdate::ChatMessageReceived - from {} ({}): {}", message.sender_username, message.sender_id, message.content);
+                    log::debug!("GuiUpdate::ChatMessageReceived - from {} ({}): {}", message.sender_username, message.sender_id, message.content);
                     
                     // Only add message if we're in a room
                     if let Some(ref room) = self.current_room {
@@ -396,9 +424,9 @@ impl EnhancedPqcChatApp {
                             if chat_history.len() > 100 {
                                 chat_history.remove(0);
                             }
-                            eprintln!("DEBUG: Added message to room {}. Total messages: {}", room_id, chat_history.len());
+                            log::debug!("Added message to room {}. Total messages: {}", room_id, chat_history.len());
                         } else {
-                            eprintln!("DEBUG: Skipped duplicate message");
+                            log::debug!("Skipped duplicate message");
                         }
                     }
                 },
@@ -419,7 +447,12 @@ impl EnhancedPqcChatApp {
                             match decoder_guard.decode(&data) {
                                 Ok(samples) => {
                                     let num_samples = samples.len();
-                                    let max_amplitude = samples.iter().map(|s| s.abs()).fold(0.0f32, f32::max);
+                                    // Only scan the frame when the trace line below will be printed
+                                    let max_amplitude = if log::log_enabled!(log::Level::Trace) {
+                                        samples.iter().map(|s| s.abs()).fold(0.0f32, f32::max)
+                                    } else {
+                                        0.0
+                                    };
                                     
                                     let mut producer = producer.lock().unwrap();
                                     
@@ -433,22 +466,22 @@ impl EnhancedPqcChatApp {
                                         }
                                     }
                                     
-                                    eprintln!("DEBUG: Audio from {}: {} compressed bytes → {} samples, pushed {}, max_amp={:.4}", 
-                                              sender_id, data.len(), num_samples, pushed_count, max_amplitude);
+                                    log::trace!("Audio from {}: {} compressed bytes → {} samples, pushed {}, max_amp={:.4}", 
+                                                sender_id, data.len(), num_samples, pushed_count, max_amplitude);
                                     
                                     if pushed_count < num_samples {
-                                        eprintln!("WARNING: Buffer full, dropped {} samples", num_samples - pushed_count);
+                                        log::warn!("Buffer full, dropped {} samples", num_samples - pushed_count);
                                     }
                                 }
                                 Err(e) => {
-                                    eprintln!("ERROR: Opus decode failed: {}", e);
+                                    log::error!("Opus decode failed: {}", e);
                                 }
                             }
                         } else {
-                            eprintln!("DEBUG: Received audio but no decoder (call not started?)");
+                            log::debug!("Received audio but no decoder (call not started?)");
                         }
                     } else {
-                        eprintln!("DEBUG: Received audio but no producer (call not started?)");
+                        log::debug!("Received audio but no producer (call not started?)");
                     }
                 },
             }
@@ -463,6 +496,20 @@ impl EnhancedPqcChatApp {
         }
     }
 
+    /// Ask the server for the room list, unless it was asked very recently
+    ///
+    /// Bursts of refresh clicks collapse into one round-trip; joining, leaving
+    /// or creating a room clears the throttle so the next refresh goes out.
+    fn request_room_list(&mut self) {
+        if let Some(last) = self.last_room_list_request {
+            if last.elapsed() < ROOM_LIST_REFRESH_INTERVAL {
+                return;
+            }
+        }
+        self.last_room_list_request = Some(std::time::Instant::now());
+        self.send_command(GuiCommand::ListRooms);
+    }
+
     fn send_command(&self, command: GuiCommand) {
         if let Some(sender) = &self.command_sender {
             // Non-blocking send from GUI thread; drop when full instead of blocking
@@ -505,9 +552,9 @@ impl EnhancedPqcChatApp {
                     OpusEncoder::new().expect("Failed to create Opus encoder")
                 )
             }).lock() {
-                match encoder_guard.encode(&samples) {
+                match encoder_guard.encode(samples) {
                     Ok(compressed) => {
-                        eprintln!("DEBUG: Opus compressed {} samples to {} bytes", samples.len(), compressed.len());
+                        log::trace!("Opus compressed {} samples to {} bytes", samples.len(), compressed.len());
                         
                         // Send compressed audio to server (non-blocking)
                         if let Some(sender) = &command_sender {
@@ -515,7 +562,7 @@ impl EnhancedPqcChatApp {
                         }
                     }
                     Err(e) => {
-                        eprintln!("ERROR: Opus encode failed: {}", e);
+                        log::error!("Opus encode failed: {}", e);
                     }
                 }
             }
@@ -543,7 +590,7 @@ impl EnhancedPqcChatApp {
             while producer.push(0.0).is_ok() {
                 // Fill with silence to flush old audio
             }
-            eprintln!("DEBUG: Cleared audio buffer on stop");
+            log::debug!("Cleared audio buffer on stop");
         }
         
         // Stop audio manager
@@ -568,8 +615,12 @@ impl eframe::App for EnhancedPqcChatApp {
         // Process updates from backend
         self.process_updates();
 
-        // Request repaint for live updates
-        ctx.request_repaint();
+        // Wake up periodically for live updates instead of repainting every frame
+        ctx.request_repaint_after(if self.audio_call_active {
+            CALL_UPDATE_POLL_INTERVAL
+        } else {
+            UPDATE_POLL_INTERVAL
+        });
 
         // Top menu bar
         egui::TopBottomPanel::top("top_panel").show(ctx, |ui| {
@@ -648,22 +699,27 @@ impl eframe::App for EnhancedPqcChatApp {
                     ui.horizontal(|ui| {
                         ui.label("🏠 Available Rooms:");
                         if ui.button("🔄").clicked() {
-                            self.send_command(GuiCommand::ListRooms);
+                            self.request_room_list();
                         }
                     });
                     
+                    // Rows are uniform, so only lay out the ones scrolled into view
+                    let row_height = (ui.text_style_height(&egui::TextStyle::Button)
+                        + 2.0 * ui.spacing().button_padding.y)
+                        .max(ui.spacing().interact_size.y);
                     egui::ScrollArea::vertical()
                         .max_height(200.0)
-                        .show(ui, |ui| {
-                            for (idx, room) in self.rooms.iter().enumerate() {
+                        .show_rows(ui, row_height, self.rooms.len(), |ui, row_range| {
+                            // show_rows assumes every row is exactly row_height,
+                            // so long room names must not wrap onto a second line
+                            ui.style_mut().wrap = Some(false);
+                            let visible = self.rooms.iter().zip(&self.room_labels).enumerate()
+                                .skip(row_range.start)
+                                .take(row_range.len());
+                            for (idx, (room, label)) in visible {
                                 let is_selected = self.selected_room_idx == Some(idx);
-                                let response = ui.selectable_label(is_selected, format!(
-                                    "🏠 {} ({}/{}{})",
-                                    room.name,
-                                    room.participants,
-                                    room.max_participants,
-                                    if room.is_locked { " 🔒" } else { "" }
-                                ));
+                                let response = ui.selectable_label(is_selected, label.as_str())
+                                    .on_hover_text(label.as_str());
                                 
                                 if response.clicked() {
                                     self.selected_room_idx = Some(idx);
@@ -697,6 +753,7 @@ impl eframe::App for EnhancedPqcChatApp {
                             max_participants: 10,
                         });
                         self.new_room_name.clear();
+                        self.last_room_list_request = None;
                     }
                 }
             });
@@ -1066,11 +1123,11 @@ async fn communication_task(
                 } => {
                     match result {
                         Ok(msg) => {
-                            eprintln!("DEBUG: Received message in main loop: {:?}", msg);
+                            log::trace!("Received message in main loop: {:?}", msg);
                             process_server_message(msg, &update_sender).await;
                         }
                         Err(e) => {
-                            eprintln!("DEBUG: Connection error in main loop: {:?}", e);
+                            log::debug!("Connection error in main loop: {:?}", e);
                             // Connection closed
                             connection = None;
                             let _ = update_sender.send(GuiUpdate::Disconnected);
@@ -1119,17 +1176,27 @@ async fn connect_to_server(
     use tokio_rustls::TlsConnector;
     use std::sync::Arc;
     
-    // Create TLS config that accepts self-signed certificates (for development)
-    let tls_config = rustls::ClientConfig::builder()
-        .dangerous()
-        .with_custom_certificate_verifier(Arc::new(NoVerifier))
-        .with_no_client_auth();
+    // Create TLS config that accepts self-signed certificates (for development).
+    // Built once and shared, so the session cache inside it survives
+    // disconnect/connect cycles and reconnects resume instead of doing a full
+    // handshake.
+    static TLS_CONFIG: std::sync::OnceLock<Arc<rustls::ClientConfig>> = std::sync::OnceLock::new();
+    let tls_config = TLS_CONFIG.get_or_init(|| {
+        Arc::new(
+            rustls::ClientConfig::builder()
+                .dangerous()
+                .with_custom_certificate_verifier(Arc::new(NoVerifier))
+                .with_no_client_auth(),
+        )
+    });
     
-    let connector = TlsConnector::from(Arc::new(tls_config));
+    let connector = TlsConnector::from(tls_config.clone());
     
     // Connect to server
     let addr = format!("{}:{}", host, port);
     let stream = TcpStream::connect(&addr).await?;
+    // Signaling is small request/response frames; don't let Nagle hold them back
+    stream.set_nodelay(true)?;
     let server_name = ServerName::try_from(host.to_string())?;
     let mut tls_stream = connector.connect(server_name, stream).await?;
     
@@ -1189,13 +1256,13 @@ async fn handle_command(
         GuiCommand::SendMessage { content } => {
             // Send chat message
             let msg = SignalingMessage::SendMessage { content: content.clone() };
-            eprintln!("DEBUG: Sending message to server: {}", content);
-            eprintln!("DEBUG: Message JSON: {}", serde_json::to_string(&msg).unwrap_or_else(|_| "ERROR".to_string()));
+            log::debug!("Sending message to server: {}", content);
+            log::debug!("Message JSON: {}", serde_json::to_string(&msg).unwrap_or_else(|_| "ERROR".to_string()));
             send_message(stream, &msg).await?;
             // Read and discard the acknowledgment response
             // The actual message will come via broadcast to all participants
             let ack = receive_message(stream).await?;
-            eprintln!("DEBUG: Received acknowledgment: {:?}", ack);
+            log::debug!("Received acknowledgment: {:?}", ack);
             return Ok(());
         },
         GuiCommand::SendAudioData { data } => {
@@ -1301,18 +1368,18 @@ async fn process_server_message(
     message: SignalingMessage,
     update_sender: &mpsc::UnboundedSender<GuiUpdate>,
 ) {
-    eprintln!("DEBUG: process_server_message called with: {:?}", message);
+    log::trace!("process_server_message called with: {:?}", message);
     // Handle unsolicited broadcasts from the server (messages, participant joins/leaves, etc.)
     match message {
         SignalingMessage::MessageReceived { sender_id, sender_username, content, timestamp } => {
-            eprintln!("DEBUG: Processing MessageReceived from {} ({}): {}", sender_username, sender_id, content);
+            log::debug!("Processing MessageReceived from {} ({}): {}", sender_username, sender_id, content);
             let chat_message = ChatMessage {
                 sender_id: sender_id.clone(),
                 sender_username: sender_username.clone(),
                 content: content.clone(),
                 timestamp: std::time::UNIX_EPOCH + std::time::Duration::from_secs(timestamp),
             };
-            eprintln!("DEBUG: Sending GuiUpdate::ChatMessageReceived");
+            log::debug!("Sending GuiUpdate::ChatMessageReceived");
             let _ = update_sender.send(GuiUpdate::ChatMessageReceived { message: chat_message });
         },
         SignalingMessage::ParticipantJoined { participant_id, username } => {
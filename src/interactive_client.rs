@@ -55,15 +55,15 @@ async fn main() -> Result<()> {
 
     // Load configuration
     let config = if args.config.exists() {
-        ClientConfig::from_file(args.config.to_str().unwrap())?
+        ClientConfig::from_file(&args.config)?
     } else {
         info!("Config file not found, using defaults");
         ClientConfig::default()
     };
 
-    let host = args.host.unwrap_or(config.server_host.clone());
+    let host = args.host.unwrap_or_else(|| config.server_host.clone());
     let port = args.port.unwrap_or(config.signaling_port);
-    let username = args.username.unwrap_or(config.default_username.clone());
+    let username = args.username.unwrap_or_else(|| config.default_username.clone());
 
     println!("🚀 PQC Chat Interactive Client");
     println!("================================");
@@ -84,6 +84,8 @@ async fn main() -> Result<()> {
     println!("🔌 Connecting to server...");
 
     let stream = TcpStream::connect(addr).await?;
+    // Signaling is small request/response frames; don't let Nagle hold them back
+    stream.set_nodelay(true)?;
     let server_name = ServerName::try_from(host.clone())?;
     let mut tls_stream = connector.connect(server_name, stream).await?;
 
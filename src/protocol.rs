@@ -167,11 +167,12 @@ impl SignalingMessage {
 
     /// Create a framed message with length prefix (4 bytes, big-endian)
     pub fn to_framed(&self) -> Result<Vec<u8>, serde_json::Error> {
-        let data = self.to_bytes()?;
-        let len = (data.len() as u32).to_be_bytes();
-        let mut framed = Vec::with_capacity(4 + data.len());
-        framed.extend_from_slice(&len);
-        framed.extend_from_slice(&data);
+        // Serialize straight after a placeholder prefix and patch the length
+        // in afterwards, instead of serializing and then copying into a frame
+        let mut framed = vec![0u8; 4];
+        serde_json::to_writer(&mut framed, self)?;
+        let len = ((framed.len() - 4) as u32).to_be_bytes();
+        framed[..4].copy_from_slice(&len);
         Ok(framed)
     }
 }
@@ -204,4 +205,16 @@ mod tests {
         let len = u32::from_be_bytes([framed[0], framed[1], framed[2], framed[3]]);
         assert_eq!(len as usize, framed.len() - 4);
     }
+
+    #[test]
+    fn test_framed_payload_matches_bytes() {
+        let msg = SignalingMessage::ListRooms;
+        let framed = msg.to_framed().unwrap();
+        
+        assert_eq!(&framed[4..], msg.to_bytes().unwrap().as_slice());
+        assert!(matches!(
+            SignalingMessage::from_bytes(&framed[4..]).unwrap(),
+            SignalingMessage::ListRooms
+        ));
+    }
 }
@@ -4,6 +4,7 @@
 
 use parking_lot::RwLock;
 use std::collections::HashMap;
+use std::sync::atomic::{AtomicU64, Ordering};
 use std::sync::Arc;
 use std::time::SystemTime;
 use uuid::Uuid;
@@ -132,22 +133,33 @@ pub enum RoomError {
 /// Manages all chat rooms
 pub struct RoomManager {
     rooms: RwLock<HashMap<String, Arc<Room>>>,
+    /// Maps room name to room ID
+    room_names: RwLock<HashMap<String, String>>,
     /// Maps participant ID to room ID
     participant_rooms: RwLock<HashMap<String, String>>,
+    /// Bumped whenever the room list or a room's occupancy changes
+    generation: AtomicU64,
 }
 
 impl RoomManager {
     pub fn new() -> Self {
         Self {
             rooms: RwLock::new(HashMap::new()),
+            room_names: RwLock::new(HashMap::new()),
             participant_rooms: RwLock::new(HashMap::new()),
+            generation: AtomicU64::new(0),
         }
     }
 
     /// Create a new room
     pub fn create_room(&self, name: String, max_participants: u32) -> Arc<Room> {
         let room = Arc::new(Room::new(name, max_participants));
-        self.rooms.write().insert(room.id.clone(), room.clone());
+        let mut rooms = self.rooms.write();
+        rooms.insert(room.id.clone(), room.clone());
+        // Name lookups resolve to the most recently created room
+        self.room_names.write().insert(room.name.clone(), room.id.clone());
+        drop(rooms);
+        self.bump_generation();
         log::info!("Created room: {} ({})", room.name, room.id);
         room
     }
@@ -159,7 +171,8 @@ impl RoomManager {
 
     /// Get a room by name
     pub fn get_room_by_name(&self, name: &str) -> Option<Arc<Room>> {
-        self.rooms.read().values().find(|r| r.name == name).cloned()
+        let room_id = self.room_names.read().get(name).cloned()?;
+        self.get_room(&room_id)
     }
 
     /// List all rooms
@@ -179,29 +192,37 @@ impl RoomManager {
         }
 
         let room = self.get_room(room_id).ok_or(RoomError::RoomNotFound)?;
-        room.add_participant(participant.clone())?;
+        let participant_id = participant.id.clone();
+        let username = participant.username.clone();
+        room.add_participant(participant)?;
         self.participant_rooms
             .write()
-            .insert(participant.id.clone(), room_id.to_string());
+            .insert(participant_id, room_id.to_string());
+        self.bump_generation();
         
-        log::info!("Participant {} joined room {}", participant.username, room.name);
+        log::info!("Participant {} joined room {}", username, room.name);
         Ok(room)
     }
 
     /// Leave current room
-    pub fn leave_room(&self, participant_id: &str) -> Result<(), RoomError> {
+    ///
+    /// Returns the room that was left, if it still exists, so callers can
+    /// notify the remaining participants without looking it up again.
+    pub fn leave_room(&self, participant_id: &str) -> Result<Option<Arc<Room>>, RoomError> {
         let room_id = self
             .participant_rooms
             .write()
             .remove(participant_id)
             .ok_or(RoomError::ParticipantNotFound)?;
 
-        if let Some(room) = self.get_room(&room_id) {
+        let room = self.get_room(&room_id);
+        if let Some(room) = &room {
             room.remove_participant(participant_id);
+            self.bump_generation();
             log::info!("Participant {} left room {}", participant_id, room.name);
         }
 
-        Ok(())
+        Ok(room)
     }
 
     /// Get the room a participant is in
@@ -212,19 +233,45 @@ impl RoomManager {
 
     /// Delete a room
     pub fn delete_room(&self, room_id: &str) -> bool {
-        if let Some(room) = self.rooms.write().remove(room_id) {
+        let mut rooms = self.rooms.write();
+        if let Some(room) = rooms.remove(room_id) {
+            let mut names = self.room_names.write();
+            if names.get(&room.name).map(String::as_str) == Some(room_id) {
+                // Fall back to another room with the same name, if any
+                match rooms.values().find(|r| r.name == room.name) {
+                    Some(other) => names.insert(room.name.clone(), other.id.clone()),
+                    None => names.remove(&room.name),
+                };
+            }
+            drop(names);
+            drop(rooms);
+
             // Remove all participants from mapping
             let participant_ids = room.get_participant_ids();
             let mut pr = self.participant_rooms.write();
             for pid in participant_ids {
                 pr.remove(&pid);
             }
+            drop(pr);
+            self.bump_generation();
             log::info!("Deleted room: {} ({})", room.name, room.id);
             true
         } else {
             false
         }
     }
+
+    /// Current change counter for the room list
+    ///
+    /// Any value derived from `list_rooms` is still current as long as the
+    /// generation read before deriving it has not changed.
+    pub fn generation(&self) -> u64 {
+        self.generation.load(Ordering::Acquire)
+    }
+
+    fn bump_generation(&self) {
+        self.generation.fetch_add(1, Ordering::Release);
+    }
 }
 
 impl Default for RoomManager {
@@ -283,7 +330,45 @@ mod tests {
         assert!(participant_room.is_some());
         assert_eq!(participant_room.unwrap().id, room_id);
         
-        manager.leave_room("p1").unwrap();
+        let left = manager.leave_room("p1").unwrap();
+        assert_eq!(left.unwrap().id, room_id);
         assert!(manager.get_participant_room("p1").is_none());
     }
+
+    #[test]
+    fn test_get_room_by_name() {
+        let manager = RoomManager::new();
+        
+        let first = manager.create_room("Lobby".to_string(), 10);
+        let second = manager.create_room("Lobby".to_string(), 10);
+        assert_eq!(manager.get_room_by_name("Lobby").unwrap().id, second.id);
+        
+        assert!(manager.delete_room(&second.id));
+        assert_eq!(manager.get_room_by_name("Lobby").unwrap().id, first.id);
+        
+        assert!(manager.delete_room(&first.id));
+        assert!(manager.get_room_by_name("Lobby").is_none());
+    }
+
+    #[test]
+    fn test_generation_tracks_changes() {
+        let manager = RoomManager::new();
+        let start = manager.generation();
+        
+        let room = manager.create_room("Test Room".to_string(), 10);
+        let after_create = manager.generation();
+        assert!(after_create > start);
+        
+        let participant = Participant::new("p1".to_string(), "User1".to_string());
+        manager.join_room(&room.id, participant).unwrap();
+        let after_join = manager.generation();
+        assert!(after_join > after_create);
+        
+        manager.get_room(&room.id);
+        manager.list_rooms();
+        assert_eq!(manager.generation(), after_join);
+        
+        manager.leave_room("p1").unwrap();
+        assert!(manager.generation() > after_join);
+    }
 }
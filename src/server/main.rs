@@ -4,16 +4,16 @@
 
 use anyhow::Result;
 use clap::Parser;
-use log::{error, info};
-use parking_lot::RwLock;
+use log::{debug, error, info, trace, warn};
+use parking_lot::{Mutex, RwLock};
 use std::collections::HashMap;
 use std::net::SocketAddr;
 use std::path::PathBuf;
 use std::sync::Arc;
 use tokio::io::{AsyncReadExt, AsyncWriteExt};
 use tokio::net::TcpListener;
-use tokio::sync::mpsc;
-use tokio_rustls::rustls::{self, pki_types::PrivateKeyDer};
+use tokio::sync::{mpsc, Notify};
+use tokio_rustls::rustls::{self, crypto::CryptoProvider, pki_types::PrivateKeyDer, CipherSuite};
 use tokio_rustls::TlsAcceptor;
 use uuid::Uuid;
 
@@ -23,6 +23,12 @@ use pqc_chat::protocol::{ParticipantInfo, RoomInfo, ServerUserInfo, SignalingMes
 use pqc_chat::room::{Participant, RoomManager};
 use pqc_chat::ServerConfig;
 
+/// Messages that can be queued for one client, so a stalled connection
+/// cannot grow memory without bound
+const CLIENT_QUEUE_CAPACITY: usize = 256;
+/// Queue slots audio may never take, kept free for room and chat events
+const CONTROL_QUEUE_RESERVE: usize = 32;
+
 /// Command-line arguments
 #[derive(Parser, Debug)]
 #[command(name = "pqc-server")]
@@ -45,21 +51,31 @@ struct Args {
     log_level: String,
 }
 
+/// A message queued for delivery to a client
+enum Outbound {
+    Message(SignalingMessage),
+    /// Already length-prefixed and serialized, written as-is
+    Frame(Arc<Vec<u8>>),
+}
+
 /// Client connection state
 struct ClientState {
     participant_id: String,
     username: Option<String>,
     shared_secret: Option<Vec<u8>>,
-    message_tx: mpsc::UnboundedSender<SignalingMessage>,
+    message_tx: mpsc::Sender<Outbound>,
+    /// Signalled to drop a client that has stopped reading its queue
+    disconnect: Arc<Notify>,
 }
 
 impl ClientState {
-    fn new(message_tx: mpsc::UnboundedSender<SignalingMessage>) -> Self {
+    fn new(message_tx: mpsc::Sender<Outbound>) -> Self {
         Self {
             participant_id: Uuid::new_v4().to_string(),
             username: None,
             shared_secret: None,
             message_tx,
+            disconnect: Arc::new(Notify::new()),
         }
     }
 }
@@ -69,6 +85,8 @@ struct ServerState {
     room_manager: RoomManager,
     media_forwarder: RwLock<MediaForwarder>,
     clients: RwLock<HashMap<String, Arc<RwLock<ClientState>>>>,
+    /// Framed RoomList response, tagged with the room manager generation
+    room_list_cache: Mutex<Option<(u64, Arc<Vec<u8>>)>>,
 }
 
 impl ServerState {
@@ -77,7 +95,37 @@ impl ServerState {
             room_manager: RoomManager::new(),
             media_forwarder: RwLock::new(MediaForwarder::new(audio_port, video_port)),
             clients: RwLock::new(HashMap::new()),
+            room_list_cache: Mutex::new(None),
+        }
+    }
+
+    /// Framed RoomList response, rebuilt only when the rooms have changed
+    fn room_list_frame(&self) -> Result<Arc<Vec<u8>>, serde_json::Error> {
+        let mut cache = self.room_list_cache.lock();
+        // Read the generation before listing, so a change made while the
+        // list is being built leaves the cached entry stale
+        let generation = self.room_manager.generation();
+        if let Some((cached_generation, frame)) = cache.as_ref() {
+            if *cached_generation == generation {
+                return Ok(frame.clone());
+            }
         }
+
+        let rooms: Vec<RoomInfo> = self
+            .room_manager
+            .list_rooms()
+            .iter()
+            .map(|r| RoomInfo {
+                id: r.id.clone(),
+                name: r.name.clone(),
+                participants: r.participant_count() as u32,
+                max_participants: r.max_participants,
+                is_locked: r.is_locked,
+            })
+            .collect();
+        let frame = Arc::new(SignalingMessage::RoomList { rooms }.to_framed()?);
+        *cache = Some((generation, frame.clone()));
+        Ok(frame)
     }
 }
 
@@ -91,13 +139,13 @@ async fn main() -> Result<()> {
 
     // Load configuration
     let config = if args.config.exists() {
-        ServerConfig::from_file(args.config.to_str().unwrap())?
+        ServerConfig::from_file(&args.config)?
     } else {
         info!("Config file not found, using defaults");
         ServerConfig::default()
     };
 
-    let host = args.host.unwrap_or(config.signaling_host.clone());
+    let host = args.host.unwrap_or_else(|| config.signaling_host.clone());
     let port = args.port.unwrap_or(config.signaling_port);
 
     // Load TLS certificates
@@ -105,9 +153,17 @@ async fn main() -> Result<()> {
     let key = load_key(&config.keyfile)?;
 
     // Configure TLS
-    let tls_config = rustls::ServerConfig::builder()
+    let prefer_chacha = !has_hardware_aes();
+    let mut tls_config = rustls::ServerConfig::builder_with_provider(tls_provider(prefer_chacha))
+        .with_safe_default_protocol_versions()?
         .with_no_client_auth()
         .with_single_cert(certs, key)?;
+    // The client's order puts AES-GCM first, so make ours win when it differs
+    tls_config.ignore_client_order = prefer_chacha;
+    // Use stateless (encrypted) session tickets instead of the default
+    // 256-entry in-memory session cache: resumption then survives cache
+    // eviction under many clients and also covers TLS 1.2
+    tls_config.ticketer = rustls::crypto::ring::Ticketer::new()?;
 
     let acceptor = TlsAcceptor::from(Arc::new(tls_config));
 
@@ -122,9 +178,20 @@ async fn main() -> Result<()> {
     let listener = TcpListener::bind(addr).await?;
     info!("PQC Chat Server listening on {}", addr);
 
-    // Accept connections
+    let shutdown = shutdown_signal();
+    tokio::pin!(shutdown);
+
+    // Accept connections until asked to shut down
     loop {
-        let (stream, peer_addr) = listener.accept().await?;
+        let (stream, peer_addr) = tokio::select! {
+            accepted = listener.accept() => accepted?,
+            _ = &mut shutdown => break,
+        };
+        // Signaling and relayed audio are small frames; don't let Nagle
+        // hold them back waiting for ACKs
+        if let Err(e) = stream.set_nodelay(true) {
+            error!("Failed to set TCP_NODELAY for {}: {}", peer_addr, e);
+        }
         let acceptor = acceptor.clone();
         let state = state.clone();
 
@@ -142,6 +209,78 @@ async fn main() -> Result<()> {
             }
         });
     }
+
+    info!("Shutting down");
+    state.media_forwarder.write().stop();
+    Ok(())
+}
+
+/// Crypto provider for the TLS listener
+///
+/// Without AES instructions (e.g. Raspberry Pi 4) ChaCha20-Poly1305 is several
+/// times faster than AES-GCM, so it is moved to the front of the suite list.
+fn tls_provider(prefer_chacha: bool) -> Arc<CryptoProvider> {
+    let mut provider = rustls::crypto::ring::default_provider();
+    if prefer_chacha {
+        info!("No hardware AES detected, preferring ChaCha20-Poly1305");
+        provider.cipher_suites.sort_by_key(|suite| {
+            !matches!(
+                suite.suite(),
+                CipherSuite::TLS13_CHACHA20_POLY1305_SHA256
+                    | CipherSuite::TLS_ECDHE_ECDSA_WITH_CHACHA20_POLY1305_SHA256
+                    | CipherSuite::TLS_ECDHE_RSA_WITH_CHACHA20_POLY1305_SHA256
+            )
+        });
+    }
+    Arc::new(provider)
+}
+
+/// Whether the CPU has AES instructions that AES-GCM can use
+fn has_hardware_aes() -> bool {
+    #[cfg(any(target_arch = "x86", target_arch = "x86_64"))]
+    {
+        std::arch::is_x86_feature_detected!("aes")
+    }
+    #[cfg(target_arch = "aarch64")]
+    {
+        std::arch::is_aarch64_feature_detected!("aes")
+    }
+    #[cfg(not(any(target_arch = "x86", target_arch = "x86_64", target_arch = "aarch64")))]
+    {
+        true
+    }
+}
+
+/// Resolve when the process receives Ctrl-C or, on Unix, SIGTERM
+async fn shutdown_signal() {
+    let ctrl_c = async {
+        if let Err(e) = tokio::signal::ctrl_c().await {
+            error!("Failed to listen for Ctrl-C: {}", e);
+            std::future::pending::<()>().await;
+        }
+    };
+
+    #[cfg(unix)]
+    let terminate = async {
+        use tokio::signal::unix::{signal, SignalKind};
+        match signal(SignalKind::terminate()) {
+            Ok(mut sigterm) => {
+                sigterm.recv().await;
+            }
+            Err(e) => {
+                error!("Failed to listen for SIGTERM: {}", e);
+                std::future::pending::<()>().await;
+            }
+        }
+    };
+
+    #[cfg(not(unix))]
+    let terminate = std::future::pending::<()>();
+
+    tokio::select! {
+        _ = ctrl_c => {}
+        _ = terminate => {}
+    }
 }
 
 /// Handle a connected client
@@ -154,10 +293,14 @@ where
     S: tokio::io::AsyncRead + tokio::io::AsyncWrite + Unpin + Send + 'static,
 {
     // Create message channel for broadcasting to this client
-    let (message_tx, mut message_rx) = mpsc::unbounded_channel();
+    let (message_tx, mut message_rx) = mpsc::channel(CLIENT_QUEUE_CAPACITY);
+    // Responses wait for queue space, so a client that stops reading only
+    // slows down its own requests
+    let response_tx = message_tx.clone();
     
     let client_state = Arc::new(RwLock::new(ClientState::new(message_tx)));
     let participant_id = client_state.read().participant_id.clone();
+    let disconnect = client_state.read().disconnect.clone();
 
     // Register client
     state
@@ -170,11 +313,16 @@ where
     
     // Spawn task to handle outgoing messages (broadcasts from server)
     let broadcast_task = tokio::spawn(async move {
-        while let Some(message) = message_rx.recv().await {
-            if let Ok(data) = message.to_framed() {
-                if write_half.write_all(&data).await.is_err() {
-                    break;
-                }
+        while let Some(outbound) = message_rx.recv().await {
+            let written = match outbound {
+                Outbound::Message(message) => match message.to_framed() {
+                    Ok(data) => write_half.write_all(&data).await,
+                    Err(_) => continue,
+                },
+                Outbound::Frame(frame) => write_half.write_all(&frame).await,
+            };
+            if written.is_err() {
+                break;
             }
         }
     });
@@ -183,11 +331,21 @@ where
     let mut read_stream = read_half;
 
     let result = async {
+        // Reused for every message on this connection
+        let mut msg_buf = Vec::new();
         loop {
             // Read message length (4 bytes)
             let mut len_buf = [0u8; 4];
-            if read_stream.read_exact(&mut len_buf).await.is_err() {
-                break;
+            tokio::select! {
+                read = read_stream.read_exact(&mut len_buf) => {
+                    if read.is_err() {
+                        break;
+                    }
+                }
+                _ = disconnect.notified() => {
+                    warn!("Disconnecting {}: not reading its messages", peer_addr);
+                    break;
+                }
             }
 
             let msg_len = u32::from_be_bytes(len_buf) as usize;
@@ -198,7 +356,8 @@ where
             }
 
             // Read message
-            let mut msg_buf = vec![0u8; msg_len];
+            msg_buf.clear();
+            msg_buf.resize(msg_len, 0);
             if read_stream.read_exact(&mut msg_buf).await.is_err() {
                 break;
             }
@@ -209,9 +368,20 @@ where
                     let response =
                         handle_message(message, &participant_id, &client_state, &state).await;
                     
-                    // Send response through the client's message channel
-                    if let Some(client) = state.clients.read().get(&participant_id) {
-                        let _ = client.read().message_tx.send(response);
+                    // Send response through the client's message channel,
+                    // giving up if the client is dropped while we wait
+                    if let Some(response) = response {
+                        tokio::select! {
+                            sent = response_tx.send(response) => {
+                                if sent.is_err() {
+                                    break;
+                                }
+                            }
+                            _ = disconnect.notified() => {
+                                warn!("Disconnecting {}: not reading its messages", peer_addr);
+                                break;
+                            }
+                        }
                     }
                 }
                 Err(e) => {
@@ -219,8 +389,16 @@ where
                     let error_msg = SignalingMessage::Error {
                         message: "Invalid message format".to_string(),
                     };
-                    if let Some(client) = state.clients.read().get(&participant_id) {
-                        let _ = client.read().message_tx.send(error_msg);
+                    tokio::select! {
+                        sent = response_tx.send(Outbound::Message(error_msg)) => {
+                            if sent.is_err() {
+                                break;
+                            }
+                        }
+                        _ = disconnect.notified() => {
+                            warn!("Disconnecting {}: not reading its messages", peer_addr);
+                            break;
+                        }
                     }
                 }
             }
@@ -232,29 +410,26 @@ where
     // Cleanup
     state.clients.write().remove(&participant_id);
     
-    // Notify other room participants that this user left
-    if let Some(room) = state.room_manager.get_participant_room(&participant_id) {
-        let _username = client_state.read().username.clone().unwrap_or_default();
+    // Leave the room first, then notify the remaining participants
+    if let Ok(Some(room)) = state.room_manager.leave_room(&participant_id) {
         broadcast_to_room(&state, &room.id, &participant_id, SignalingMessage::ParticipantLeft {
             participant_id: participant_id.clone(),
         }).await;
     }
-    
-    let _ = state.room_manager.leave_room(&participant_id);
     broadcast_task.abort();
     info!("Client {} disconnected", peer_addr);
 
     result
 }
 
-/// Handle a signaling message
+/// Handle a signaling message, returning the reply to queue, if any
 async fn handle_message(
     message: SignalingMessage,
     participant_id: &str,
     client_state: &Arc<RwLock<ClientState>>,
     state: &Arc<ServerState>,
-) -> SignalingMessage {
-    match message {
+) -> Option<Outbound> {
+    let response = match message {
         SignalingMessage::Login { username } => {
             client_state.write().username = Some(username.clone());
             info!("User {} logged in as {}", participant_id, username);
@@ -280,21 +455,12 @@ async fn handle_message(
             }
         }
 
-        SignalingMessage::ListRooms => {
-            let rooms: Vec<RoomInfo> = state
-                .room_manager
-                .list_rooms()
-                .iter()
-                .map(|r| RoomInfo {
-                    id: r.id.clone(),
-                    name: r.name.clone(),
-                    participants: r.participant_count() as u32,
-                    max_participants: r.max_participants,
-                    is_locked: r.is_locked,
-                })
-                .collect();
-            SignalingMessage::RoomList { rooms }
-        }
+        SignalingMessage::ListRooms => match state.room_list_frame() {
+            Ok(frame) => return Some(Outbound::Frame(frame)),
+            Err(e) => SignalingMessage::Error {
+                message: format!("Failed to list rooms: {}", e),
+            },
+        },
 
         SignalingMessage::ListServerUsers => {
             let clients = state.clients.read();
@@ -392,13 +558,10 @@ async fn handle_message(
         }
 
         SignalingMessage::LeaveRoom => {
-            // Get room info before leaving
-            let room_info = state.room_manager.get_participant_room(participant_id);
-            
             match state.room_manager.leave_room(participant_id) {
-                Ok(()) => {
+                Ok(left_room) => {
                     // Broadcast to other participants that someone left
-                    if let Some(room) = room_info {
+                    if let Some(room) = left_room {
                         broadcast_to_room(&state, &room.id, participant_id, SignalingMessage::ParticipantLeft {
                             participant_id: participant_id.to_string(),
                         }).await;
@@ -480,14 +643,16 @@ async fn handle_message(
                 broadcast_to_room(&state, &room_id, participant_id, audio_message).await;
             }
             
-            // No response needed for audio data
-            SignalingMessage::Error { message: "Audio forwarded".to_string() }
+            // No response for audio data: one reply per frame would fill the
+            // sender's own queue if it stops reading
+            return None;
         }
 
         _ => SignalingMessage::Error {
             message: "Unsupported message type".to_string(),
         },
-    }
+    };
+    Some(Outbound::Message(response))
 }
 
 /// Load TLS certificates
@@ -513,29 +678,8 @@ async fn broadcast_to_room(
     sender_id: &str, 
     message: SignalingMessage
 ) {
-    if let Some(room) = state.room_manager.get_room(room_id) {
-        let participant_ids = room.get_participant_ids();
-        let clients = state.clients.read();
-        
-        info!("Broadcasting {:?} to room {} (except sender {})", message, room_id, sender_id);
-        info!("Participants in room: {:?}", participant_ids);
-        
-        for participant_id in participant_ids {
-            // Don't send to the sender
-            if participant_id != sender_id {
-                if let Some(client_state) = clients.get(&participant_id) {
-                    info!("Sending broadcast to participant {}", participant_id);
-                    if let Err(e) = client_state.read().message_tx.send(message.clone()) {
-                        error!("Failed to send broadcast to {}: {}", participant_id, e);
-                    }
-                } else {
-                    info!("Client {} not found in clients map", participant_id);
-                }
-            }
-        }
-    } else {
-        info!("Room {} not found for broadcast", room_id);
-    }
+    debug!("Broadcasting to room {} (except sender {})", room_id, sender_id);
+    send_to_room(state, room_id, Some(sender_id), message);
 }
 
 /// Broadcast a message to all participants in a room including the sender
@@ -544,24 +688,81 @@ async fn broadcast_to_room_all(
     room_id: &str, 
     message: SignalingMessage
 ) {
-    if let Some(room) = state.room_manager.get_room(room_id) {
-        let participant_ids = room.get_participant_ids();
+    debug!("Broadcasting to all in room {}", room_id);
+    send_to_room(state, room_id, None, message);
+}
+
+/// Queue a message for every participant in a room, optionally skipping one
+fn send_to_room(
+    state: &ServerState,
+    room_id: &str,
+    exclude: Option<&str>,
+    message: SignalingMessage,
+) {
+    let Some(room) = state.room_manager.get_room(room_id) else {
+        debug!("Room {} not found for broadcast", room_id);
+        return;
+    };
+    let participant_ids = room.get_participant_ids();
+    trace!("Participants in room: {:?}", participant_ids);
+    
+    // Snapshot the recipients' channels and release the clients lock before
+    // sending, so connects and disconnects never wait on a broadcast
+    let targets: Vec<_> = {
         let clients = state.clients.read();
-        
-        info!("Broadcasting {:?} to all in room {}", message, room_id);
-        info!("Participants in room: {:?}", participant_ids);
-        
-        for participant_id in participant_ids {
-            if let Some(client_state) = clients.get(&participant_id) {
-                info!("Sending broadcast to participant {}", participant_id);
-                if let Err(e) = client_state.read().message_tx.send(message.clone()) {
-                    error!("Failed to send broadcast to {}: {}", participant_id, e);
+        participant_ids
+            .into_iter()
+            .filter(|participant_id| Some(participant_id.as_str()) != exclude)
+            .filter_map(|participant_id| match clients.get(&participant_id) {
+                Some(client_state) => {
+                    let client = client_state.read();
+                    Some((participant_id, client.message_tx.clone(), client.disconnect.clone()))
+                }
+                None => {
+                    debug!("Client {} not found in clients map", participant_id);
+                    None
                 }
-            } else {
-                info!("Client {} not found in clients map", participant_id);
+            })
+            .collect()
+    };
+    
+    if targets.is_empty() {
+        return;
+    }
+    
+    let is_audio = matches!(message, SignalingMessage::AudioDataReceived { .. });
+    
+    // Serialize once; every recipient gets the same framed bytes
+    let frame = match message.to_framed() {
+        Ok(data) => Arc::new(data),
+        Err(e) => {
+            error!("Failed to serialize broadcast for room {}: {}", room_id, e);
+            return;
+        }
+    };
+    
+    for (participant_id, tx, disconnect) in targets {
+        trace!("Sending broadcast to participant {}", participant_id);
+        // Never wait on a recipient. Audio is lossy and gives way first,
+        // leaving reserved room for control messages behind it
+        if is_audio && tx.capacity() <= CONTROL_QUEUE_RESERVE {
+            debug!("Dropping audio for {}: send queue full", participant_id);
+            continue;
+        }
+        match tx.try_send(Outbound::Frame(frame.clone())) {
+            Ok(()) => {}
+            Err(mpsc::error::TrySendError::Full(_)) => {
+                // Even the reserve is used up: the client has stopped
+                // reading. Losing a join/leave or chat message would leave
+                // its view wrong for good, so drop the connection instead
+                warn!("Send queue full for {}, disconnecting", participant_id);
+                disconnect.notify_one();
+            }
+            Err(mpsc::error::TrySendError::Closed(_)) => {
+                // The writer has already exited; the connection is closing
+                // and will be removed from the room by its own cleanup
+                debug!("Skipping broadcast to {}: connection closed", participant_id);
             }
         }
-    } else {
-        info!("Room {} not found for broadcast", room_id);
     }
 }